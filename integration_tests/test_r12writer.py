@@ -2,9 +2,12 @@
 # License: MIT License
 import pytest
 import os
+import io
 from random import random
+import numpy as np
 import ezdxf
 from ezdxf.addons import r12writer
+from ezdxf.addons.r12writer import R12FastStreamWriter
 
 MAX_X_COORD = 1000.0
 MAX_Y_COORD = 1000.0
@@ -53,6 +56,42 @@ def test_write_r12(filename):
     assert os.path.exists(filename)
 
 
+CIRCLES = [(0, 0, 1), (1.5, -2.25, 0.5), (1 / 3, 2 / 3, 7.123456789)]
+
+
+def write_circles(circles, **kwargs) -> str:
+    stream = io.StringIO()
+    dxf = R12FastStreamWriter(stream)
+    dxf.add_circles(circles, **kwargs)
+    dxf.close()
+    return stream.getvalue()
+
+
+@pytest.mark.parametrize(
+    "circles", [CIRCLES, np.array(CIRCLES)], ids=["tuples", "ndarray"]
+)
+def test_add_circles_is_equal_to_add_circle(circles):
+    attribs = dict(layer="CIRCLES", color=3, linetype="DASHED")
+    stream = io.StringIO()
+    dxf = R12FastStreamWriter(stream)
+    for x, y, radius in circles:
+        dxf.add_circle((x, y), radius, **attribs)
+    dxf.close()
+
+    assert write_circles(circles, **attribs) == stream.getvalue()
+
+
+@pytest.mark.parametrize("layer", ["50%", "A%sB"])
+def test_add_circles_with_percent_sign_in_layer_name(layer):
+    stream = io.StringIO()
+    dxf = R12FastStreamWriter(stream)
+    for x, y, radius in CIRCLES:
+        dxf.add_circle((x, y), radius, layer=layer)
+    dxf.close()
+
+    assert write_circles(CIRCLES, layer=layer) == stream.getvalue()
+
+
 def test_read_r12(filename):
     dwg = ezdxf.readfile(filename)
     msp = dwg.modelspace()
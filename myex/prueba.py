@@ -3,13 +3,38 @@ import sys
 from os.path import dirname
 sys.path.append(dirname('../src/'))
 
-from random import random
+import os
+from io import StringIO
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 from ezdxf.addons import r12writer
+from ezdxf.addons.r12writer import R12FastStreamWriter
 
 MAX_X_COORD = 1000
 MAX_Y_COORD = 1000
+COUNT = 100000
+
+
+def circle_entities(count: int) -> str:
+    """Returns `count` random circles as DXF string, the R12 writer does not
+    write handles, therefore the strings of all processes can be concatenated.
+    """
+    # rows of (x, y, radius)
+    circles = np.random.default_rng().random((count, 3))
+    circles = circles * [MAX_X_COORD, MAX_Y_COORD, 0] + [0, 0, 2]
+    stream = StringIO()
+    writer = R12FastStreamWriter(stream)
+    start = stream.tell()  # skip the section header
+    writer.add_circles(circles)
+    return stream.getvalue()[start:]
 
-with r12writer("many_circles.dxf") as doc:
-    for _ in range(100000):
-        doc.add_circle((MAX_X_COORD*random(), MAX_Y_COORD*random()), radius=2)
 
+if __name__ == "__main__":
+    workers = os.cpu_count() or 1
+    chunks = [COUNT // workers] * workers
+    chunks[0] += COUNT % workers
+    with ProcessPoolExecutor(workers) as executor:
+        with r12writer("many_circles.dxf") as doc:
+            for entities in executor.map(circle_entities, chunks):
+                doc.stream.write(entities)
@@ -37,6 +37,22 @@ cdef void set_floats(double *m, object values) except *:
     if i != 16:
         raise ValueError("invalid argument count")
 
+cdef void mul4x4(const double *m1, const double *m2, double *res):
+    # res = m1 x m2; res must not share memory with m1 or m2!
+    # Shared scalar kernel of __mul__(), __matmul__(), __imul__() and chain().
+    cdef int row, i
+    cdef double a0, a1, a2, a3
+    for row in range(4):
+        i = row * 4
+        a0 = m1[i]
+        a1 = m1[i + 1]
+        a2 = m1[i + 2]
+        a3 = m1[i + 3]
+        res[i] = a0 * m2[0] + a1 * m2[4] + a2 * m2[8] + a3 * m2[12]
+        res[i + 1] = a0 * m2[1] + a1 * m2[5] + a2 * m2[9] + a3 * m2[13]
+        res[i + 2] = a0 * m2[2] + a1 * m2[6] + a2 * m2[10] + a3 * m2[14]
+        res[i + 3] = a0 * m2[3] + a1 * m2[7] + a2 * m2[11] + a3 * m2[15]
+
 cdef class Matrix44:
     def __cinit__(self, *args):
         cdef int nargs = len(args)
@@ -353,60 +369,37 @@ cdef class Matrix44:
     @staticmethod
     def chain(*matrices: Matrix44) -> Matrix44:
         cdef Matrix44 transformation = Matrix44()
-        for matrix in matrices:
-            transformation *= matrix
+        cdef Matrix44 matrix
+        cdef double[16] m1
+        if len(matrices) == 0:
+            return transformation
+        # the multiplication with the initial identity matrix is not required:
+        matrix = matrices[0]
+        transformation.m = matrix.m
+        for matrix in matrices[1:]:
+            m1 = transformation.m
+            mul4x4(m1, matrix.m, transformation.m)
         return transformation
 
     def __imul__(self, Matrix44 other) -> Matrix44:
         cdef double[16] m1 = self.m
         cdef double *m2 = other.m
-
-        self.m[0] = m1[0] * m2[0] + m1[1] * m2[4] + m1[2] * m2[8] + \
-                    m1[3] * m2[12]
-        self.m[1] = m1[0] * m2[1] + m1[1] * m2[5] + m1[2] * m2[9] + \
-                    m1[3] * m2[13]
-        self.m[2] = m1[0] * m2[2] + m1[1] * m2[6] + m1[2] * m2[10] + \
-                    m1[3] * m2[14]
-        self.m[3] = m1[0] * m2[3] + m1[1] * m2[7] + m1[2] * m2[11] + \
-                    m1[3] * m2[15]
-
-        self.m[4] = m1[4] * m2[0] + m1[5] * m2[4] + m1[6] * m2[8] + \
-                    m1[7] * m2[12]
-        self.m[5] = m1[4] * m2[1] + m1[5] * m2[5] + m1[6] * m2[9] + \
-                    m1[7] * m2[13]
-        self.m[6] = m1[4] * m2[2] + m1[5] * m2[6] + m1[6] * m2[10] + \
-                    m1[7] * m2[14]
-        self.m[7] = m1[4] * m2[3] + m1[5] * m2[7] + m1[6] * m2[11] + \
-                    m1[7] * m2[15]
-
-        self.m[8] = m1[8] * m2[0] + m1[9] * m2[4] + m1[10] * m2[8] + \
-                    m1[11] * m2[12]
-        self.m[9] = m1[8] * m2[1] + m1[9] * m2[5] + m1[10] * m2[9] + \
-                    m1[11] * m2[13]
-        self.m[10] = m1[8] * m2[2] + m1[9] * m2[6] + m1[10] * m2[10] + \
-                     m1[11] * m2[14]
-        self.m[11] = m1[8] * m2[3] + m1[9] * m2[7] + m1[10] * m2[11] + \
-                     m1[11] * m2[15]
-
-        self.m[12] = m1[12] * m2[0] + m1[13] * m2[4] + m1[14] * m2[8] + \
-                     m1[15] * m2[12]
-        self.m[13] = m1[12] * m2[1] + m1[13] * m2[5] + m1[14] * m2[9] + \
-                     m1[15] * m2[13]
-        self.m[14] = m1[12] * m2[2] + m1[13] * m2[6] + m1[14] * m2[10] + \
-                     m1[15] * m2[14]
-        self.m[15] = m1[12] * m2[3] + m1[13] * m2[7] + m1[14] * m2[11] + \
-                     m1[15] * m2[15]
+        if other is self:  # m *= m; self.m is overwritten by the result
+            m2 = m1
+        mul4x4(m1, m2, self.m)
         return self
 
     def __mul__(self, Matrix44 other) -> Matrix44:
-        cdef Matrix44 res_matrix = self.copy()
-        return res_matrix.__imul__(other)
+        cdef Matrix44 res_matrix = Matrix44()
+        mul4x4(self.m, other.m, res_matrix.m)
+        return res_matrix
 
     # __matmul__ = __mul__ does not work!
 
     def __matmul__(self, Matrix44 other) -> Matrix44:
-        cdef Matrix44 res_matrix = self.copy()
-        return res_matrix.__imul__(other)
+        cdef Matrix44 res_matrix = Matrix44()
+        mul4x4(self.m, other.m, res_matrix.m)
+        return res_matrix
 
     def transpose(self) -> None:
         swap(&self.m[1], &self.m[4])
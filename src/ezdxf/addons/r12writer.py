@@ -176,6 +176,37 @@ class R12FastStreamWriter:
         dxf.append(dxf_tag(40, str(rnd(radius))))
         self.stream.write("".join(dxf))
 
+    def add_circles(
+        self,
+        circles: Iterable[Sequence[float]],
+        layer: str = "0",
+        color: Optional[int] = None,
+        linetype: Optional[str] = None,
+    ) -> None:
+        """Add multiple CIRCLE entities with the same DXF attributes at once.
+        This is much faster than calling :meth:`add_circle` for each circle.
+
+        Args:
+            circles: iterable of ``(x, y, radius)`` tuples or a numpy array of
+                shape (n, 3)
+            layer: layer name as string see :meth:`add_line`
+            color: color as :ref:`ACI` see :meth:`add_line`
+            linetype: line type as string see :meth:`add_line`
+
+        """
+        try:  # numpy arrays: convert all values to Python floats at once
+            circles = circles.tolist()  # type: ignore
+        except AttributeError:
+            pass
+        # layer and linetype names may contain "%", format only the coordinates:
+        prefix = "0\nCIRCLE\n" + dxf_attribs(layer, color, linetype)
+        template = "10\n%s\n20\n%s\n40\n%s\n"
+        self.stream.write(
+            "".join(
+                prefix + template % (rnd(x), rnd(y), rnd(r)) for x, y, r in circles
+            )
+        )
+
     def add_arc(
         self,
         center: Vertex,
@@ -1,7 +1,7 @@
 # Copyright (c) 2019-2023 Manfred Moitzi
 # License: MIT License
 from __future__ import annotations
-from typing import TYPE_CHECKING, Union, Optional
+from typing import TYPE_CHECKING, Union, Optional, cast
 from ezdxf.lldxf.tags import Tags
 from ezdxf.lldxf.const import DXFStructureError
 from ezdxf.lldxf.const import (
@@ -39,31 +39,36 @@ class ExtensionDict:
 
     """
 
-    __slots__ = ("_xdict",)
+    __slots__ = ("_xdict", "_resolved")
 
     def __init__(self, xdict: Union[str, Dictionary]):
         # 1st loading stage: xdict as string -> handle to dict
         # 2nd loading stage: xdict as DXF Dictionary
         self._xdict = xdict
+        # check the loading stage once and not at each access:
+        self._resolved = not isinstance(xdict, str)
 
-    @property
-    def dictionary(self) -> Dictionary:
+    def _get_dict(self) -> Dictionary:
         """Returns the underlying :class:`~ezdxf.entities.Dictionary` object."""
         xdict = self._xdict
         assert xdict is not None, "destroyed extension dictionary"
-        assert not isinstance(xdict, str), f"dictionary handle #{xdict} not resolved"
-        return xdict
+        assert self._resolved, f"dictionary handle #{xdict} not resolved"
+        # the resolved state is stored in a slot, narrow the type by cast():
+        return cast("Dictionary", xdict)
+
+    # no additional call level for the frequently used dictionary property:
+    dictionary = property(_get_dict)
 
     @property
     def handle(self) -> str:
         """Returns the handle of the underlying :class:`~ezdxf.entities.Dictionary`
         object.
         """
-        return self.dictionary.dxf.handle
+        return self._get_dict().dxf.handle
 
     def __getitem__(self, key: str):
         """Get self[key]."""
-        return self.dictionary[key]
+        return self._get_dict()[key]
 
     def __setitem__(self, key: str, value):
         """Set self[key] to value.
@@ -84,7 +89,7 @@ class ExtensionDict:
 
     def __contains__(self, key: str):
         """Return `key` in self."""
-        return key in self.dictionary
+        return key in self._get_dict()
 
     def __len__(self):
         """Returns count of extension dictionary entries."""
@@ -103,7 +108,7 @@ class ExtensionDict:
 
     def get(self, key: str, default=None) -> Optional[DXFEntity]:
         """Return extension dictionary entry `key`."""
-        return self.dictionary.get(key, default)
+        return self._get_dict().get(key, default)
 
     def discard(self, key: str) -> None:
         """Discard extension dictionary entry `key`."""
@@ -139,9 +144,9 @@ class ExtensionDict:
         really exist and is valid.
         """
         xdict = self._xdict
-        if xdict is None or isinstance(xdict, str):
+        if xdict is None or not self._resolved:
             return False
-        return xdict.is_alive
+        return cast("Dictionary", xdict).is_alive
 
     def update_owner(self, handle: str) -> None:
         """Update owner tag of underlying :class:`~ezdxf.entities.Dictionary`
@@ -165,11 +170,15 @@ class ExtensionDict:
         handle = self._xdict
         assert isinstance(handle, str)
         self._xdict = doc.entitydb.get(handle)  # type: ignore
+        self._resolved = True
 
     def export_dxf(self, tagwriter: AbstractTagWriter) -> None:
-        assert self._xdict is not None
         xdict = self._xdict
-        handle = xdict if isinstance(xdict, str) else xdict.dxf.handle
+        assert xdict is not None
+        if self._resolved:
+            handle = cast("Dictionary", xdict).dxf.handle
+        else:
+            handle = cast(str, xdict)
         tagwriter.write_tag2(APP_DATA_MARKER, ACAD_XDICTIONARY)
         tagwriter.write_tag2(XDICT_HANDLE_CODE, handle)
         tagwriter.write_tag2(APP_DATA_MARKER, "}")
@@ -59,6 +59,19 @@ class Point(Protocol):
 
 
 class Node:
+    __slots__ = (
+        "i",
+        "point",
+        "x",
+        "y",
+        "prev",
+        "next",
+        "z",
+        "prev_z",
+        "next_z",
+        "steiner",
+    )
+
     def __init__(self, i: int, point: Point) -> None:
         self.i: int = i
 
@@ -127,15 +140,13 @@ def earcut(exterior: list[T], holes: list[list[T]]) -> list[Sequence[T]]:
     # if the shape is not too simple, we'll use z-order curve hash later
     # calculate polygon bbox
     if len(exterior) > 80:
-        min_x = max_x = exterior[0].x
-        min_y = max_y = exterior[0].y
-        for point in exterior:
-            x = point.x
-            y = point.y
-            min_x = min(min_x, x)
-            min_y = min(min_y, y)
-            max_x = max(max_x, x)
-            max_y = max(max_y, y)
+        # extract coordinates once, min() and max() scan the lists at C-level
+        xs = [point.x for point in exterior]
+        ys = [point.y for point in exterior]
+        min_x = min(xs)
+        min_y = min(ys)
+        max_x = max(xs)
+        max_y = max(ys)
 
         # min_x, min_y and inv_size are later used to transform coords into
         # integers for z-order calculation
@@ -8,6 +8,7 @@ from __future__ import annotations
 from typing import Sequence, Iterable, Iterator, TYPE_CHECKING, Optional
 import math
 import numpy as np
+from functools import lru_cache
 import numpy.typing as npt
 
 from math import sin, cos, tan
@@ -30,6 +31,25 @@ def floats(items: Iterable) -> list[float]:
     return [float(v) for v in items]
 
 
+@lru_cache(maxsize=256)
+def _axis_rotation(x: float, y: float, z: float, angle: float) -> tuple[float, ...]:
+    # Returns the 16 components of the rotation matrix about the axis (x, y, z),
+    # rotations about the same axis by the same angles are common in CAD
+    # applications.
+    c = cos(angle)
+    s = sin(angle)
+    omc = 1.0 - c
+    x, y, z = Vec3(x, y, z).normalize()
+    # fmt: off
+    return (
+        x * x * omc + c, y * x * omc + z * s, x * z * omc - y * s, 0.,
+        x * y * omc - z * s, y * y * omc + c, y * z * omc + x * s, 0.,
+        x * z * omc + y * s, y * z * omc - x * s, z * z * omc + c, 0.,
+        0., 0., 0., 1.
+    )
+    # fmt: on
+
+
 class Matrix44:
     """An optimized 4x4 `transformation matrix`_.
 
@@ -104,7 +124,7 @@ class Matrix44:
         A more correct transformation could be implemented like so:
         https://stackoverflow.com/questions/10629737/convert-3d-4x4-rotation-matrix-into-2d
         """
-        m = self._matrix
+        m = self._matrix.tolist()
         return m[0], m[1], 0.0, m[4], m[5], 0.0, m[12], m[13], 1.0
 
     @staticmethod
@@ -136,7 +156,9 @@ class Matrix44:
         """
         if 0 <= row < 4:
             index = row * 4
-            return tuple(self._matrix[index : index + 4])
+            # tolist() returns Python floats, which are faster to create and
+            # to process than numpy scalars
+            return tuple(self._matrix[index : index + 4].tolist())
         else:
             raise IndexError(f"invalid row index: {row}")
 
@@ -161,8 +183,7 @@ class Matrix44:
             col: column index [0 .. 3]
         """
         if 0 <= col < 4:
-            m = self._matrix
-            return m[col], m[col + 4], m[col + 8], m[col + 12]
+            return tuple(self._matrix[col::4].tolist())
         else:
             raise IndexError(f"invalid row index: {col}")
 
@@ -336,18 +357,8 @@ class Matrix44:
             angle: rotation angle in radians
 
         """
-        c = cos(angle)
-        s = sin(angle)
-        omc = 1.0 - c
-        x, y, z = Vec3(axis).normalize()
-        # fmt: off
-        return cls([
-            x * x * omc + c, y * x * omc + z * s, x * z * omc - y * s, 0.,
-            x * y * omc - z * s, y * y * omc + c, y * z * omc + x * s, 0.,
-            x * z * omc + y * s, y * z * omc - x * s, z * z * omc + c, 0.,
-            0., 0., 0., 1.
-        ])
-        # fmt: on
+        x, y, z = Vec3(axis)
+        return cls(_axis_rotation(x, y, z, float(angle)))
 
     @classmethod
     def xyz_rotate(cls, angle_x: float, angle_y: float, angle_z: float) -> Matrix44:
@@ -452,10 +463,15 @@ class Matrix44:
     @staticmethod
     def chain(*matrices: Matrix44) -> Matrix44:
         """Compose a transformation matrix from one or more `matrices`."""
-        transformation = Matrix44()
-        for matrix in matrices:
-            transformation *= matrix
-        return transformation
+        if len(matrices) == 0:
+            return Matrix44()
+        # Multiply the numpy arrays and create a single Matrix44 object at the
+        # end, the multiplication with the identity matrix is not required.
+        result = matrices[0]._matrix.reshape(4, 4)
+        for matrix in matrices[1:]:
+            result = np.matmul(result, matrix._matrix.reshape(4, 4))
+        # __init__() copies the array of a single matrix:
+        return Matrix44(result.reshape(16))
 
     @staticmethod
     def ucs(
@@ -499,13 +515,13 @@ class Matrix44:
         """Get (row, column) element."""
         row, col = index
         if 0 <= row < 4 and 0 <= col < 4:
-            return self._matrix[row * 4 + col]
+            return self._matrix.item(row * 4 + col)
         else:
             raise IndexError(f"index out of range: {index}")
 
     def __iter__(self) -> Iterator[float]:
         """Iterates over all matrix values."""
-        return iter(self._matrix)
+        return iter(self._matrix.tolist())
 
     def __mul__(self, other: Matrix44) -> Matrix44:
         """Returns a new matrix as result of the matrix multiplication with
@@ -513,8 +529,10 @@ class Matrix44:
         """
         m1 = self._matrix.reshape(4, 4)
         m2 = other._matrix.reshape(4, 4)
-        result = np.matmul(m1, m2)
-        return self.__class__(np.ravel(result))
+        # the result is a new contiguous array, no copy by __init__() required:
+        result = self.__class__.__new__(self.__class__)
+        result._matrix = np.matmul(m1, m2).reshape(16)
+        return result
 
     # __matmul__ = __mul__ does not work!
 
@@ -524,15 +542,16 @@ class Matrix44:
         """
         m1 = self._matrix.reshape(4, 4)
         m2 = other._matrix.reshape(4, 4)
-        result = np.matmul(m1, m2)
-        return self.__class__(np.ravel(result))
+        # the result is a new contiguous array, no copy by __init__() required:
+        result = self.__class__.__new__(self.__class__)
+        result._matrix = np.matmul(m1, m2).reshape(16)
+        return result
 
     def __imul__(self, other: Matrix44) -> Matrix44:
         """Inplace multiplication with another matrix."""
         m1 = self._matrix.reshape(4, 4)
         m2 = other._matrix.reshape(4, 4)
-        result = np.matmul(m1, m2)
-        self._matrix = np.ravel(result)
+        self._matrix = np.matmul(m1, m2).reshape(16)
         return self
 
     def rows(self) -> Iterator[tuple[float, ...]]:
@@ -545,7 +564,7 @@ class Matrix44:
 
     def transform(self, vector: UVec) -> Vec3:
         """Returns a transformed vertex."""
-        m = self._matrix
+        m = self._matrix.tolist()
         x, y, z = Vec3(vector)
         # fmt: off
         return Vec3(
@@ -557,7 +576,7 @@ class Matrix44:
 
     def transform_direction(self, vector: UVec, normalize=False) -> Vec3:
         """Returns a transformed direction vector without translation."""
-        m = self._matrix
+        m = self._matrix.tolist()
         x, y, z = Vec3(vector)
         # fmt: off
         v = Vec3(
@@ -572,13 +591,14 @@ class Matrix44:
 
     def transform_vertices(self, vectors: Iterable[UVec]) -> Iterator[Vec3]:
         """Returns an iterable of transformed vertices."""
+        # Python floats: arithmetic with numpy scalars is much slower
         # fmt: off
         (
             m0, m1, m2, m3,
             m4, m5, m6, m7,
             m8, m9, m10, m11,
             m12, m13, m14, m15,
-        ) = self._matrix
+        ) = self._matrix.tolist()
         # fmt: on
         for vector in vectors:
             x, y, z = Vec3(vector)
@@ -607,7 +627,7 @@ class Matrix44:
         .. versionadded:: 1.1
 
         """
-        m = self._matrix
+        m = self._matrix.tolist()
         m0 = m[0]
         m1 = m[1]
         m4 = m[4]
@@ -653,7 +673,7 @@ class Matrix44:
         translation.
 
         """
-        m0, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, *_ = self._matrix
+        m0, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, *_ = self._matrix.tolist()
         for vector in vectors:
             x, y, z = Vec3(vector)
             # fmt: off
@@ -683,7 +703,7 @@ class Matrix44:
         (internal API)
 
         """
-        m0, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, *_ = self._matrix
+        m0, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, *_ = self._matrix.tolist()
         x, y, z = wcs
         # fmt: off
         return Vec3(
@@ -702,7 +722,7 @@ class Matrix44:
 
     def determinant(self) -> float:
         """Returns determinant."""
-        return np.linalg.det(self._matrix.reshape(4, 4))
+        return float(np.linalg.det(self._matrix.reshape(4, 4)))
 
     def inverse(self) -> None:
         """Calculates the inverse of the matrix.
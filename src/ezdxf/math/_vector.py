@@ -446,10 +446,16 @@ class Vec3:
     @staticmethod
     def sum(items: Iterable[UVec]) -> Vec3:
         """Add all vectors in `items`."""
-        s = NULLVEC
+        # accumulate components like the Cython implementation, no Vec3()
+        # instance for each intermediate result
+        decompose = Vec3.decompose
+        x = y = z = 0.0
         for v in items:
-            s += v
-        return s
+            vx, vy, vz = decompose(v)
+            x += vx
+            y += vy
+            z += vz
+        return Vec3(x, y, z)
 
     def dot(self, other: UVec) -> float:
         """Dot operator: `self` . `other`
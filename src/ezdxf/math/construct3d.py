@@ -1,7 +1,7 @@
 # Copyright (c) 2020-2024, Manfred Moitzi
 # License: MIT License
 from __future__ import annotations
-from typing import Sequence, Iterable, Optional, Iterator
+from typing import Sequence, Iterable, Optional, Iterator, Callable
 from enum import IntEnum
 import math
 from ezdxf.math import (
@@ -697,12 +697,20 @@ def bending_angle(dir1: Vec3, dir2: Vec3, normal=Z_AXIS) -> float:
     raise ValueError("invalid normal vector")
 
 
+_mapbox_earcut_3d: Optional[Callable[..., Iterator[Sequence[Vec3]]]] = None
+
+
 def any_vertex_inside_face(vertices: Sequence[Vec3]) -> Vec3:
     """Returns a vertex from the "inside" of  the given face.
     """
+    global _mapbox_earcut_3d
+    if _mapbox_earcut_3d is None:
+        # late import to avoid circular imports, but only at the first call
+        from ezdxf.math.triangulation import mapbox_earcut_3d
+
+        _mapbox_earcut_3d = mapbox_earcut_3d
     # Triangulation is for concave shapes important!
-    from ezdxf.math.triangulation import mapbox_earcut_3d
-    it = mapbox_earcut_3d(vertices)
+    it = _mapbox_earcut_3d(vertices)
     return Vec3.sum(next(it)) / 3.0
 
 
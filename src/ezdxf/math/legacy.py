@@ -1,11 +1,16 @@
 # Copyright (c) 2018-2024, Manfred Moitzi
 # License: MIT License
 # legacy.py code is replaced by numpy - exists just for benchmarking, testing and nostalgia
+# The row operations of these solvers use numpy arrays: for small matrices (n<=10)
+# they are slower than the former pure Python loops, they pay off for larger
+# matrices (n~50). PyPy has no advantage for this code anymore.
 from __future__ import annotations
 from typing import Iterable, cast
 from itertools import repeat
 import reprlib
 
+import numpy as np
+
 from .linalg import Matrix, MatrixData, NDArray, Solver
 
 __all__ = [
@@ -17,10 +22,15 @@ __all__ = [
 ]
 
 
-def copy_float_matrix(A) -> MatrixData:
+def copy_float_matrix(A) -> NDArray:
     if isinstance(A, Matrix):
         A = A.matrix
-    return [[float(v) for v in row] for row in A]
+    if isinstance(A, np.ndarray):
+        return A.astype(np.float64, copy=True)
+    try:  # fast path for nested sequences, parsed at C-level
+        return np.array(A, dtype=np.float64)
+    except (TypeError, ValueError):  # rows as arbitrary iterables
+        return np.array([[float(v) for v in row] for row in A], dtype=np.float64)
 
 
 def gauss_vector_solver(A: MatrixData | NDArray, B: Iterable[float]) -> list[float]:
@@ -30,7 +40,8 @@ def gauss_vector_solver(A: MatrixData | NDArray, B: Iterable[float]) -> list[flo
     algorithm. The speed improvement is more significant for solving multiple
     right-hand side quantities as matrix at once.
 
-    Reference implementation for error checking.
+    Reference implementation for error checking, the LAPACK based
+    :func:`~ezdxf.math.linalg.numpy_vector_solver` is much faster.
 
     Args:
         A: matrix [[a11, a12, ..., a1n], [a21, a22, ..., a2n], [a21, a22, ..., a2n],
@@ -46,7 +57,7 @@ def gauss_vector_solver(A: MatrixData | NDArray, B: Iterable[float]) -> list[flo
     """
     # copy input data
     A = copy_float_matrix(A)
-    B = list(B)
+    B = np.array(list(B), dtype=np.float64)
     num = len(A)
     if len(A[0]) != num:
         raise ValueError("A square nxn matrix A is required.")
@@ -65,7 +76,8 @@ def gauss_matrix_solver(A: MatrixData | NDArray, B: MatrixData | NDArray) -> Mat
     right-hand side quantities as nxm Matrix B by the `Gauss-Elimination`_
     algorithm, which is faster than the `Gauss-Jordan`_ algorithm.
 
-    Reference implementation for error checking.
+    Reference implementation for error checking, the LAPACK based
+    :func:`~ezdxf.math.linalg.numpy_matrix_solver` is much faster.
 
     Args:
         A: matrix [[a11, a12, ..., a1n], [a21, a22, ..., a2n], [a21, a22, ..., a2n],
@@ -91,15 +103,14 @@ def gauss_matrix_solver(A: MatrixData | NDArray, B: MatrixData | NDArray) -> Mat
     # inplace modification of A & B
     _build_upper_triangle(matrix_a, matrix_b)
 
-    columns = Matrix(matrix=matrix_b).cols()
     result = Matrix()
-    for col in columns:
-        result.append_col(_backsubstitution(matrix_a, col))
+    for col in range(matrix_b.shape[1]):
+        result.append_col(_backsubstitution(matrix_a, matrix_b[:, col].copy()))
 
     return result
 
 
-def _build_upper_triangle(A: MatrixData, B: list) -> None:
+def _build_upper_triangle(A: NDArray, B: NDArray) -> None:
     """Build upper triangle for backsubstitution. Modifies A and B inplace!
 
     Args:
@@ -108,43 +119,32 @@ def _build_upper_triangle(A: MatrixData, B: list) -> None:
 
     """
     num = len(A)
-    try:
-        b_col_count = len(B[0])
-    except TypeError:
-        b_col_count = 1
-
     for i in range(0, num):
         # Search for maximum in this column
-        max_element = abs(A[i][i])
-        max_row = i
-        for row in range(i + 1, num):
-            value = abs(A[row][i])
-            if value > max_element:
-                max_element = value
-                max_row = row
+        max_row = i + int(np.argmax(np.abs(A[i:, i])))
 
         # Swap maximum row with current row
-        A[max_row], A[i] = A[i], A[max_row]
-        B[max_row], B[i] = B[i], B[max_row]
+        if max_row != i:
+            A[[i, max_row]] = A[[max_row, i]]
+            B[[i, max_row]] = B[[max_row, i]]
+
+        pivot = A[i, i]
+        if pivot == 0.0:
+            raise ZeroDivisionError("singular matrix")
 
         # Make all rows below this one 0 in current column
-        for row in range(i + 1, num):
-            c = -A[row][i] / A[i][i]
-            for col in range(i, num):
-                if i == col:
-                    A[row][col] = 0
-                else:
-                    A[row][col] += c * A[i][col]
-            if b_col_count == 1:
-                B[row] += c * B[i]
-            else:
-                for col in range(b_col_count):
-                    B[row][col] += c * B[i][col]
-
-
-def _backsubstitution(A: MatrixData, B: list[float]) -> list[float]:
+        c = -A[i + 1 :, i] / pivot
+        A[i + 1 :, i + 1 :] += np.outer(c, A[i, i + 1 :])
+        A[i + 1 :, i] = 0.0
+        if B.ndim == 1:
+            B[i + 1 :] += c * B[i]
+        else:
+            B[i + 1 :] += np.outer(c, B[i])
+
+
+def _backsubstitution(A: NDArray, B: NDArray) -> list[float]:
     """Solve equation A . x = B for an upper triangular matrix A by
-    backsubstitution.
+    backsubstitution. Modifies B inplace!
 
     Args:
         A: row major matrix
@@ -154,9 +154,10 @@ def _backsubstitution(A: MatrixData, B: list[float]) -> list[float]:
     num = len(A)
     x = [0.0] * num
     for i in range(num - 1, -1, -1):
-        x[i] = B[i] / A[i][i]
-        for row in range(i - 1, -1, -1):
-            B[row] -= A[row][i] * x[i]
+        # Python floats raise ZeroDivisionError for a singular matrix
+        xi = float(B[i]) / float(A[i, i])
+        x[i] = xi
+        B[:i] -= A[:i, i] * xi
     return x
 
 
@@ -168,7 +169,9 @@ def gauss_jordan_solver(
     which is the slowest of all, but it is very reliable. Returns a copy of the
     modified input matrix `A` and the result matrix `x`.
 
-    Internally used for matrix inverse calculation.
+    Internally used for matrix inverse calculation. Reference implementation for
+    error checking, the LAPACK based :func:`~ezdxf.math.linalg.numpy_matrix_solver`
+    is much faster.
 
     Args:
         A: matrix [[a11, a12, ..., a1n], [a21, a22, ..., a2n], [a21, a22, ..., a2n],
@@ -187,59 +190,64 @@ def gauss_jordan_solver(
     matrix_b = copy_float_matrix(B)
 
     n = len(matrix_a)
-    m = len(matrix_b[0])
 
     if len(matrix_a[0]) != n:
         raise ValueError("A square nxn matrix A is required.")
     if len(matrix_b) != n:
         raise ValueError("Row count of matrices A and B has to match.")
 
-    icol = 0
-    irow = 0
+    # inplace modification of A & B
+    _gauss_jordan_core(matrix_a, matrix_b)
+    return Matrix(matrix=matrix_a), Matrix(matrix=matrix_b)
+
+
+def _gauss_jordan_core(matrix_a: NDArray, matrix_b: NDArray) -> None:
+    """Gauss-Jordan elimination with full pivoting. Modifies A and B inplace!
+
+    Args:
+        matrix_a: square row major matrix
+        matrix_b: row major matrix
+
+    """
+    n = len(matrix_a)
     col_indices = [0] * n
     row_indices = [0] * n
-    ipiv = [0] * n
+    ipiv = np.zeros(n, dtype=np.int64)
 
     for i in range(n):
-        big = 0.0
-        for j in range(n):
-            if ipiv[j] != 1:
-                for k in range(n):
-                    if ipiv[k] == 0:
-                        if abs(matrix_a[j][k]) >= big:
-                            big = abs(matrix_a[j][k])
-                            irow = j
-                            icol = k
+        free_rows = np.flatnonzero(ipiv != 1)
+        free_cols = np.flatnonzero(ipiv == 0)
+        candidates = np.abs(matrix_a[np.ix_(free_rows, free_cols)]).ravel()
+        # last maximum in row major order, same as a scalar ">=" search
+        index = candidates.size - 1 - int(np.argmax(candidates[::-1]))
+        irow = int(free_rows[index // free_cols.size])
+        icol = int(free_cols[index % free_cols.size])
 
         ipiv[icol] += 1
         if irow != icol:
-            matrix_a[irow], matrix_a[icol] = matrix_a[icol], matrix_a[irow]
-            matrix_b[irow], matrix_b[icol] = matrix_b[icol], matrix_b[irow]
+            matrix_a[[irow, icol]] = matrix_a[[icol, irow]]
+            matrix_b[[irow, icol]] = matrix_b[[icol, irow]]
 
         row_indices[i] = irow
         col_indices[i] = icol
 
-        pivinv = 1.0 / matrix_a[icol][icol]
-        matrix_a[icol][icol] = 1.0
-        matrix_a[icol] = [v * pivinv for v in matrix_a[icol]]
-        matrix_b[icol] = [v * pivinv for v in matrix_b[icol]]
-        for row in range(n):
-            if row == icol:
-                continue
-            dum = matrix_a[row][icol]
-            matrix_a[row][icol] = 0.0
-            for col in range(n):
-                matrix_a[row][col] -= matrix_a[icol][col] * dum
-            for col in range(m):
-                matrix_b[row][col] -= matrix_b[icol][col] * dum
+        # Python floats raise ZeroDivisionError for a singular matrix
+        pivinv = 1.0 / float(matrix_a[icol, icol])
+        dum = matrix_a[:, icol].copy()
+        dum[icol] = 0.0  # excludes the pivot row from the elimination
+        matrix_a[:, icol] = 0.0
+        matrix_a[icol, icol] = 1.0
+        matrix_a[icol] *= pivinv
+        matrix_b[icol] *= pivinv
+        # eliminate all other rows at once by a rank-1 update
+        matrix_a -= np.outer(dum, matrix_a[icol])
+        matrix_b -= np.outer(dum, matrix_b[icol])
 
     for i in range(n - 1, -1, -1):
         irow = row_indices[i]
         icol = col_indices[i]
         if irow != icol:
-            for _row in matrix_a:
-                _row[irow], _row[icol] = _row[icol], _row[irow]
-    return Matrix(matrix=matrix_a), Matrix(matrix=matrix_b)
+            matrix_a[:, [irow, icol]] = matrix_a[:, [icol, irow]]
 
 
 def gauss_jordan_inverse(A: MatrixData) -> Matrix:
@@ -247,9 +255,11 @@ def gauss_jordan_inverse(A: MatrixData) -> Matrix:
 
     .. hint::
 
-        For small matrices (n<10) is this function faster than
-        LUDecomposition(m).inverse() and as fast even if the decomposition is
-        already done.
+        The row operations use numpy arrays, which makes this function slower
+        than the former pure Python implementation for small matrices
+        (n<=10) and faster for larger matrices (n~50). For larger
+        matrices it is also faster than LUDecomposition(m).inverse().
+        The LAPACK based :meth:`Matrix.inverse` is much faster than both.
 
     Raises:
         ZeroDivisionError: singular matrix
@@ -268,11 +278,14 @@ class LUDecomposition(Solver):
     for a singular matrix.
 
     This algorithm is a little bit faster than the `Gauss-Elimination`_
-    algorithm using CPython and much faster when using pypy.
+    algorithm. The decomposition uses numpy row operations like the other
+    solvers of this module, which removes the former advantage of PyPy.
+    The LAPACK based :class:`~ezdxf.math.linalg.NumpySolver` replaces this
+    class.
 
     The :attr:`LUDecomposition.matrix` attribute gives access to the matrix data
-    as list of rows like in the :class:`Matrix` class, and the :attr:`LUDecomposition.index`
-    attribute gives access to the swapped row indices.
+    as :class:`numpy.ndarray` like in the :class:`Matrix` class, and the
+    :attr:`LUDecomposition.index` attribute gives access to the swapped row indices.
 
     Args:
         A: matrix [[a11, a12, ..., a1n], [a21, a22, ..., a2n], [a21, a22, ..., a2n],
@@ -286,41 +299,37 @@ class LUDecomposition(Solver):
     __slots__ = ("matrix", "index", "_det")
 
     def __init__(self, A: MatrixData | NDArray):
-        lu: MatrixData = copy_float_matrix(A)
+        lu: NDArray = copy_float_matrix(A)
         n: int = len(lu)
         det: float = 1.0
         index: list[int] = []
 
         # find max value for each row, raises ZeroDivisionError for singular matrix!
-        scaling: list[float] = [1.0 / max(abs(v) for v in row) for row in lu]
+        row_max = np.abs(lu).max(axis=1, initial=0.0)
+        if not np.all(row_max):
+            raise ZeroDivisionError("singular matrix")
+        scaling: NDArray = 1.0 / row_max
 
         for k in range(n):
-            big: float = 0.0
-            imax: int = k
-            for i in range(k, n):
-                temp: float = scaling[i] * abs(lu[i][k])
-                if temp > big:
-                    big = temp
-                    imax = i
-
+            # argmax() returns the first max. value like the strict comparison
+            # "temp > big" of the previous loop implementation
+            imax: int = k + int(np.argmax(scaling[k:] * np.abs(lu[k:, k])))
             if k != imax:
-                for col in range(n):
-                    temp = lu[imax][col]
-                    lu[imax][col] = lu[k][col]
-                    lu[k][col] = temp
-
+                lu[[k, imax]] = lu[[imax, k]]
                 det = -det
                 scaling[imax] = scaling[k]
 
             index.append(imax)
-            for i in range(k + 1, n):
-                temp = lu[i][k] / lu[k][k]
-                lu[i][k] = temp
-                for j in range(k + 1, n):
-                    lu[i][j] -= temp * lu[k][j]
+            if k + 1 < n:
+                pivot = lu[k, k]
+                if pivot == 0.0:
+                    raise ZeroDivisionError("singular matrix")
+                factors = lu[k + 1 :, k] / pivot
+                lu[k + 1 :, k] = factors
+                lu[k + 1 :, k + 1 :] -= np.outer(factors, lu[k, k + 1 :])
 
         self.index: list[int] = index
-        self.matrix: MatrixData = lu
+        self.matrix: NDArray = lu
         self._det: float = det
 
     def __str__(self) -> str:
@@ -345,8 +354,8 @@ class LUDecomposition(Solver):
             vector as list of floats
 
         """
-        X: list[float] = [float(v) for v in B]
-        lu: MatrixData = self.matrix
+        X: NDArray = np.array([float(v) for v in B], dtype=np.float64)
+        lu: NDArray = self.matrix
         index: list[int] = self.index
         n: int = self.nrows
         ii: int = 0
@@ -358,21 +367,19 @@ class LUDecomposition(Solver):
 
         for i in range(n):
             ip: int = index[i]
-            sum_: float = X[ip]
+            sum_: float = float(X[ip])
             X[ip] = X[i]
             if ii != 0:
-                for j in range(ii - 1, i):
-                    sum_ -= lu[i][j] * X[j]
+                sum_ -= float(np.dot(lu[i, ii - 1 : i], X[ii - 1 : i]))
             elif sum_ != 0.0:
                 ii = i + 1
             X[i] = sum_
 
         for row in range(n - 1, -1, -1):
-            sum_ = X[row]
-            for col in range(row + 1, n):
-                sum_ -= lu[row][col] * X[col]
-            X[row] = sum_ / lu[row][row]
-        return X
+            sum_ = float(X[row]) - float(np.dot(lu[row, row + 1 :], X[row + 1 :]))
+            # Python floats raise ZeroDivisionError for a singular matrix
+            X[row] = sum_ / float(lu[row, row])
+        return X.tolist()
 
     def solve_matrix(self, B: MatrixData | NDArray) -> Matrix:
         """Solves the linear equation system given by the nxn Matrix A . x = B,
@@ -410,8 +417,4 @@ class LUDecomposition(Solver):
         if matrix is singular.
 
         """
-        det: float = self._det
-        lu: MatrixData = self.matrix
-        for i in range(self.nrows):
-            det *= lu[i][i]
-        return det
+        return self._det * float(np.prod(self.matrix.diagonal()))
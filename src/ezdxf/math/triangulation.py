@@ -91,7 +91,15 @@ def mapbox_earcut_3d(
         yield polygon[0], polygon[1], polygon[2]
         return
 
-    ocs = OCS(safe_normal_vector(polygon))
+    normal = safe_normal_vector(polygon)
+    if count <= 5 and not holes and _is_convex(polygon, normal):
+        # fan triangulation for small convex polygons, skips the OCS transformation
+        first = polygon[0]
+        for index in range(1, count - 1):
+            yield first, polygon[index], polygon[index + 1]
+        return
+
+    ocs = OCS(normal)
     elevation = ocs.from_wcs(polygon[0]).z
     exterior_ocs = list(ocs.points_from_wcs(polygon))
     holes_ocs: list[list[Vec3]] = []
@@ -100,7 +108,34 @@ def mapbox_earcut_3d(
 
     # Vec3 supports the _Point protocol in _mapbox_earcut.py
     # required attributes: x, y
-    for triangle in earcut(exterior_ocs, holes_ocs):
-        yield tuple(
-            ocs.points_to_wcs(Vec3(v.x, v.y, elevation) for v in triangle)
-        )
+    triangles = earcut(exterior_ocs, holes_ocs)
+
+    # earcut() returns the input objects, transform each vertex only once back
+    # to WCS instead of transforming 3 vertices for each triangle:
+    vertices_ocs = list(exterior_ocs)
+    for hole in holes_ocs:
+        vertices_ocs.extend(hole)
+    vertices_wcs = ocs.points_to_wcs(
+        Vec3(v.x, v.y, elevation) for v in vertices_ocs
+    )
+    wcs = dict(zip(map(id, vertices_ocs), vertices_wcs))
+    for a, b, c in triangles:
+        yield wcs[id(a)], wcs[id(b)], wcs[id(c)]
+
+
+def _is_convex(polygon: list[Vec3], normal: Vec3) -> bool:
+    """Returns ``True`` if the flat `polygon` is strictly convex, all other
+    vertices have to be located left of each edge in respect to the `normal`
+    vector. This check excludes self-intersecting star shaped polygons, but
+    requires n*(n-2) tests and should be used only for small polygons.
+    """
+    count = len(polygon)
+    prev = polygon[-1]
+    for index, vertex in enumerate(polygon):
+        edge = vertex - prev
+        for offset in range(1, count - 1):
+            other = polygon[(index + offset) % count]
+            if edge.cross(other - prev).dot(normal) <= 0.0:
+                return False
+        prev = vertex
+    return True
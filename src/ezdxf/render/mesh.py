@@ -30,6 +30,7 @@ from ezdxf.math import (
     subdivide_face,
     subdivide_ngons,
 )
+from ezdxf.math.triangulation import mapbox_earcut_3d
 
 if TYPE_CHECKING:
     from ezdxf.entities import Polyface, Polymesh, Mesh, Solid3d
@@ -826,8 +827,6 @@ class MeshBuilder:
         method uses the "ear clipping" algorithm which works with concave faces
         too and does not create any additional vertices.
         """
-        from ezdxf.math.triangulation import mapbox_earcut_3d
-
         for face in self.faces_as_vertices():
             if len(face) <= max_vertex_count:
                 yield face
@@ -1,7 +1,7 @@
 # Copyright (c) 2021-2023, Manfred Moitzi
 # License: MIT License
 from __future__ import annotations
-from typing import Sequence, Iterable, Optional, Tuple, NamedTuple
+from typing import Sequence, Iterable, Iterator, Optional, Tuple, NamedTuple
 from typing_extensions import TypeAlias
 import abc
 import itertools
@@ -232,54 +232,59 @@ class DoNothingRenderer(ContentRenderer):
         pass
 
 
+_IDENTITY = tuple(Matrix44())
+
 Tuple4f: TypeAlias = Tuple[float, float, float, float]
 Tuple2f: TypeAlias = Tuple[float, float]
 
 
+# margin indices for the CSS like order: top, right, bottom, left
+_MARGIN_INDICES = {
+    1: (0, 0, 0, 0),  # CSS: top, right=top, bottom=top, left=top
+    2: (0, 1, 0, 1),  # CSS: top, right, bottom=top, left=right
+    3: (0, 1, 2, 1),  # CSS: top, right, bottom, left=right
+    4: (0, 1, 2, 3),  # CSS: top, right, bottom, left
+}
+
+
 def resolve_margins(margins: Optional[Sequence[float]]) -> Tuple4f:
     """Returns the box margins in CSS like order: top, right, bottom, left."""
     if margins is None:
         return 0, 0, 0, 0
-    count = len(margins)
-    if count == 4:  # CSS: top, right, bottom, left
-        return margins[0], margins[1], margins[2], margins[3]
-    if count == 3:  # CSS: top, right, bottom, left=right
-        return margins[0], margins[1], margins[2], margins[1]
-    if count == 2:  # CSS: top, right, bottom=top, left=right
-        return margins[0], margins[1], margins[0], margins[1]
-    if count == 1:  # CSS: top, right=top, bottom=top, left=top
-        return margins[0], margins[0], margins[0], margins[0]
-    return 0, 0, 0, 0
+    indices = _MARGIN_INDICES.get(len(margins))
+    if indices is None:
+        return 0, 0, 0, 0
+    top, right, bottom, left = indices
+    return margins[top], margins[right], margins[bottom], margins[left]
+
+
+# width and height factors of the left top corner indexed by LayoutAlignment,
+# index 0 is not a valid alignment and does not shift the insert location
+_INSERT_LEFT = (0.0, 0.0, -0.5, -1.0, 0.0, -0.5, -1.0, 0.0, -0.5, -1.0)
+_INSERT_TOP = (0.0, 0.0, 0.0, 0.0, 0.5, 0.5, 0.5, 1.0, 1.0, 1.0)
 
 
 def insert_location(align: LayoutAlignment, width: float, height: float) -> Tuple2f:
     """Returns the left top corner adjusted to the given alignment."""
-    left: float = 0.0
-    top: float = 0.0
-    center = width / 2.0
-    middle = height / 2.0
-    if align == LayoutAlignment.TOP_LEFT:
-        pass
-    elif align == LayoutAlignment.TOP_CENTER:
-        left, top = (-center, 0)
-    elif align == LayoutAlignment.TOP_RIGHT:
-        left, top = (-width, 0)
-    elif align == LayoutAlignment.MIDDLE_LEFT:
-        left, top = (0, middle)
-    elif align == LayoutAlignment.MIDDLE_CENTER:
-        left, top = (-center, middle)
-    elif align == LayoutAlignment.MIDDLE_RIGHT:
-        left, top = (-width, middle)
-    elif align == LayoutAlignment.BOTTOM_LEFT:
-        left, top = (0, height)
-    elif align == LayoutAlignment.BOTTOM_CENTER:
-        left, top = (-center, height)
-    elif align == LayoutAlignment.BOTTOM_RIGHT:
-        left, top = (-width, height)
-    return left, top
+    return width * _INSERT_LEFT[align], height * _INSERT_TOP[align]
+
+
+# Cell kind tags for fast type checks in the core loops, subclasses inherit the
+# tag of their base class like for isinstance() checks:
+_TEXT = 0
+_FRACTION = 1
+_NBSP = 2
+_SPACE = 3
+_TABULATOR = 4
+_OTHER = 5
+_CONTENT_KINDS = (_TEXT, _FRACTION)
+_GLUE_KINDS = (_NBSP, _SPACE, _TABULATOR)
+_NO_BREAK_KINDS = (_TEXT, _NBSP)
 
 
 class Box(abc.ABC):
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def total_width(self) -> float: ...
@@ -313,7 +318,10 @@ class Box(abc.ABC):
 
 
 class Cell(Box):  # ABC
+    __slots__ = ()
+
     is_visible = False
+    kind = _OTHER
 
     def place(self, x: float, y: float):
         # Base cells do not render anything, therefore placing the content is
@@ -330,6 +338,8 @@ class Cell(Box):  # ABC
 
 
 class Glue(Cell):  # ABC
+    __slots__ = ("_width", "_min_width", "_max_width", "renderer")
+
     EMPTY: tuple = tuple()
 
     def __init__(
@@ -341,12 +351,17 @@ class Glue(Cell):  # ABC
         self._width: float = float(width)
         self._min_width = float(min_width) if min_width else self._width
         self._max_width: Optional[float] = max_width
+        # glue cells are invisible, but the renderer attribute is available for
+        # all cells:
+        self.renderer: Optional[ContentRenderer] = None
 
     def resize(self, width: float):
+        # conditional expressions are faster than calling min() and max()
         max_width = self._max_width
-        if max_width is not None:
-            width = min(max_width, width)
-        self._width = max(width, self._min_width)
+        if max_width is not None and width > max_width:
+            width = max_width
+        min_width = self._min_width
+        self._width = width if width > min_width else min_width
 
     @property
     def can_shrink(self):
@@ -369,15 +384,18 @@ class Glue(Cell):  # ABC
 
 
 class Space(Glue):
-    pass
+    __slots__ = ()
+    kind = _SPACE
 
 
 class NonBreakingSpace(Glue):
-    pass
+    __slots__ = ()
+    kind = _NBSP
 
 
 class Tabulator(Glue):
-    pass
+    __slots__ = ()
+    kind = _TABULATOR
 
 
 class ContentCell(Cell):  # ABC
@@ -395,6 +413,8 @@ class ContentCell(Cell):  # ABC
 
     """
 
+    __slots__ = ("_final_x", "_final_y", "_width", "_height", "valign", "renderer")
+
     is_visible = True
 
     def __init__(
@@ -461,6 +481,9 @@ class Text(ContentCell):
 
     """
 
+    __slots__ = ("stroke",)
+    kind = _TEXT
+
     def __init__(
         self,
         width: float,
@@ -473,12 +496,17 @@ class Text(ContentCell):
         self.stroke = int(stroke)  # public attribute read/write
 
     def render(self, m: Optional[Matrix44] = None) -> None:
-        left, top = self.final_location()
-        height = self.total_height
-        bottom = top - height
-        right = left + self.total_width
+        # Called for each word, read the attributes directly instead of using
+        # final_location(), total_width and total_height:
+        left = self._final_x
+        top = self._final_y
+        assert left is not None and top is not None, "cell is not placed"
         self.renderer.render(  # type: ignore
-            left=left, bottom=bottom, right=right, top=top, m=m
+            left=left,
+            bottom=top - self._height,
+            right=left + self._width,
+            top=top,
+            m=m,
         )
 
     def render_stroke(
@@ -556,6 +584,9 @@ class Fraction(ContentCell):
 
     """
 
+    __slots__ = ("_stacking", "_top_content", "_bottom_content")
+    kind = _FRACTION
+
     HEIGHT_SCALE = 1.2
 
     def __init__(
@@ -631,53 +662,65 @@ class Fraction(ContentCell):
         self.renderer.line(x1, y1, x2, y2, m)  # type: ignore
 
 
-_content = (Text, Fraction)
-_glue = (Space, NonBreakingSpace, Tabulator)
-_no_break = (Text, NonBreakingSpace)
-
-
 def normalize_cells(cells: Iterable[Cell]) -> list[Cell]:
     def replace_pending_nbsp_by_spaces():
         index = len(content) - 1
         while index >= 0:
             cell = content[index]
-            if isinstance(cell, NonBreakingSpace):
-                content[index] = cell.to_space()
+            if cell.kind == _NBSP:
+                content[index] = cell.to_space()  # type: ignore
                 index -= 1
             else:
                 return
 
-    def is_useless_nbsp():
-        try:
-            peek = cells[index + 1]
-        except IndexError:
-            return True
-        if not isinstance(prev, _no_break) or not isinstance(peek, _no_break):
-            return True
-        return False
-
-    content = []
-    cells = list(cells)
-    prev = None
-    for index, cell in enumerate(cells):
-        if isinstance(cell, _content):
-            if isinstance(prev, _content):
+    content: list[Cell] = []
+    prev_kind = _OTHER
+    it = iter(cells)
+    cell = next(it, None)
+    while cell is not None:
+        # one-step lookahead, next_cell is None for the last cell:
+        next_cell = next(it, None)
+        kind = cell.kind
+        if kind in _CONTENT_KINDS:
+            if prev_kind in _CONTENT_KINDS:
                 raise LayoutError("no glue between content cells")
-        elif isinstance(cell, NonBreakingSpace) and is_useless_nbsp():
-            cell = cell.to_space()
+        elif kind == _NBSP and not (
+            prev_kind in _NO_BREAK_KINDS
+            and next_cell is not None
+            and next_cell.kind in _NO_BREAK_KINDS
+        ):
+            # useless nbsp
+            cell = cell.to_space()  # type: ignore
+            kind = _SPACE
             replace_pending_nbsp_by_spaces()
 
-        prev = cell
+        prev_kind = kind
         content.append(cell)
+        cell = next_cell
 
     # remove pending glue:
-    while content and isinstance(content[-1], _glue):
+    while content and content[-1].kind in _GLUE_KINDS:
         content.pop()
 
     return content
 
 
 class Container(Box):
+    __slots__ = (
+        "_final_x",
+        "_final_y",
+        "_content_width",
+        "_content_height",
+        "_margins",
+        "_top_margin",
+        "_right_margin",
+        "_bottom_margin",
+        "_left_margin",
+        "_h_margin",
+        "_v_margin",
+        "renderer",
+    )
+
     def __init__(
         self,
         width: Optional[float],
@@ -696,6 +739,16 @@ class Container(Box):
 
         # margins are always defined
         self._margins: Tuple4f = resolve_margins(margins)
+        # unpacked margins for fast attribute access:
+        (
+            self._top_margin,
+            self._right_margin,
+            self._bottom_margin,
+            self._left_margin,
+        ) = self._margins
+        # sum of horizontal and vertical margins:
+        self._h_margin: float = self._left_margin + self._right_margin
+        self._v_margin: float = self._top_margin + self._bottom_margin
 
         # content renderer is optional:
         self.renderer: Optional[ContentRenderer] = renderer
@@ -706,32 +759,33 @@ class Container(Box):
         self.place_content()
 
     def final_location(self):
-        if not self.is_placed():
+        if self._final_x is None:
             raise LayoutError("Container is not placed.")
         return self._final_x, self._final_y
 
     def is_placed(self) -> bool:
-        return self._final_x is not None and self._final_y is not None
+        # place() sets both coordinates at once
+        return self._final_x is not None
 
     @abc.abstractmethod
-    def __iter__(self) -> Box:
+    def __iter__(self) -> Iterator[Box]:
         pass
 
     @property
     def top_margin(self) -> float:
-        return self._margins[0]
+        return self._top_margin
 
     @property
     def right_margin(self) -> float:
-        return self._margins[1]
+        return self._right_margin
 
     @property
     def bottom_margin(self) -> float:
-        return self._margins[2]
+        return self._bottom_margin
 
     @property
     def left_margin(self) -> float:
-        return self._margins[3]
+        return self._left_margin
 
     @property
     def content_width(self) -> float:
@@ -742,7 +796,7 @@ class Container(Box):
 
     @property
     def total_width(self) -> float:
-        return self.content_width + self.right_margin + self.left_margin
+        return self.content_width + self._h_margin
 
     @property
     def content_height(self) -> float:
@@ -757,7 +811,7 @@ class Container(Box):
 
     @property
     def total_height(self) -> float:
-        return self.content_height + self.top_margin + self.bottom_margin
+        return self.content_height + self._v_margin
 
     def render(self, m: Matrix44 = None) -> None:
         """Render container content.
@@ -777,7 +831,7 @@ class Container(Box):
 
     def render_content(self, m: Matrix44 = None) -> None:
         """Render content at the final location."""
-        for entity in self:  # type: ignore
+        for entity in self:
             entity.render(m)
 
     def render_background(self, m: Matrix44) -> None:
@@ -800,6 +854,8 @@ class EmptyParagraph(Cell):
     "line1\n\nline2".
     """
 
+    __slots__ = ("_height", "_width", "_last_line_spacing")
+
     def __init__(self, cap_height: float, line_spacing: float = 1):
         self._height: float = cap_height
         self._width: float = 0
@@ -825,6 +881,18 @@ class EmptyParagraph(Cell):
 
 
 class Paragraph(Container):
+    __slots__ = (
+        "_align",
+        "_indent_first",
+        "_indent_left",
+        "_indent_right",
+        "_line_spacing",
+        "_tab_stops",
+        "_cells",
+        "_lines",
+        "_last_line_spacing",
+    )
+
     def __init__(
         self,
         width: Optional[float] = None,  # defined by parent container
@@ -861,7 +929,7 @@ class Paragraph(Container):
         return self._last_line_spacing
 
     def set_total_width(self, width: float):
-        self._content_width = width - self.left_margin - self.right_margin
+        self._content_width = width - self._h_margin
         if self._content_width < 1e-6:
             raise LayoutError("invalid width, no usable space left")
 
@@ -875,8 +943,8 @@ class Paragraph(Container):
 
     def place_content(self):
         x, y = self.final_location()
-        x += self.left_margin
-        y -= self.top_margin
+        x += self._left_margin
+        y -= self._top_margin
         first = True
         lines = self._lines
         for line in lines:
@@ -899,9 +967,8 @@ class Paragraph(Container):
         height = 0.0
         if len(lines):
             last_line = lines[-1]
-            height = sum(
-                leading(line.total_height, line_spacing) for line in lines[:-1]
-            )
+            for line in lines[:-1]:
+                height += leading(line.total_height, line_spacing)
             # do not add line spacing after last line!
             last_line_height = last_line.total_height
             self._last_line_spacing = (
@@ -947,7 +1014,7 @@ class Paragraph(Container):
         first: bool = True  # is current line the first line?
 
         # current paragraph height:
-        paragraph_height: float = self.top_margin + self.bottom_margin
+        paragraph_height: float = self._v_margin
 
         # localize enums for core loop optimization:
         # CPython 3.9 access is around 3x faster, no difference for PyPy 3.7!
@@ -1040,6 +1107,8 @@ class Paragraph(Container):
 
 
 class Column(Container):
+    __slots__ = ("_gutter", "_paragraphs", "_leading_height")
+
     def __init__(
         self,
         width: float,
@@ -1052,6 +1121,9 @@ class Column(Container):
         # spacing between columns
         self._gutter = gutter
         self._paragraphs: list[Paragraph] = []
+        # sum of the total height and the distance to the next paragraph of all
+        # paragraphs except the last one, updated by append_paragraphs():
+        self._leading_height = 0.0
 
     def clone_empty(self) -> Column:
         return self.__class__(
@@ -1059,10 +1131,10 @@ class Column(Container):
             height=self.content_height,
             gutter=self.gutter,
             margins=(
-                self.top_margin,
-                self.right_margin,
-                self.bottom_margin,
-                self.left_margin,
+                self._top_margin,
+                self._right_margin,
+                self._bottom_margin,
+                self._left_margin,
             ),
             renderer=self.renderer,
         )
@@ -1086,13 +1158,9 @@ class Column(Container):
 
     def used_content_height(self) -> float:
         paragraphs = self._paragraphs
-        height = 0.0
         if paragraphs:
-            height = sum(
-                p.total_height + p.distance_to_next_paragraph for p in paragraphs[:-1]
-            )
-            height += paragraphs[-1].total_height
-        return height
+            return self._leading_height + paragraphs[-1].total_height
+        return 0.0
 
     @property
     def gutter(self):
@@ -1110,31 +1178,43 @@ class Column(Container):
 
     def place_content(self):
         x, y = self.final_location()
-        x += self.left_margin
-        y -= self.top_margin
+        x += self._left_margin
+        y -= self._top_margin
         for p in self._paragraphs:
             p.place(x, y)
             y -= p.total_height + p.distance_to_next_paragraph
 
     def append_paragraphs(self, paragraphs: Iterable[Paragraph]) -> list[Paragraph]:
         remainder: list[Paragraph] = []
-        for paragraph in paragraphs:
-            if remainder:
-                remainder.append(paragraph)
-                continue
+        it = iter(paragraphs)
+        for paragraph in it:
             paragraph.set_total_width(self.content_width)
             if self.has_flex_height:
                 height = None
             else:
                 height = self.max_content_height - self.used_content_height()  # type: ignore
             rest = paragraph.distribute_content(height)
-            self._paragraphs.append(paragraph)
+            self._append_paragraph(paragraph)
             if rest is not None:
                 remainder.append(rest)
+                # the following paragraphs do not fit into this column:
+                remainder.extend(it)
+                break
         return remainder
 
+    def _append_paragraph(self, paragraph: Paragraph) -> None:
+        # Update the used content height incrementally, a full recalculation
+        # for each appended paragraph is O(n²)
+        paragraphs = self._paragraphs
+        if paragraphs:
+            last = paragraphs[-1]
+            self._leading_height += last.total_height + last.distance_to_next_paragraph
+        paragraphs.append(paragraph)
+
 
 class Layout(Container):
+    __slots__ = ("_reference_column_width", "_current_column", "_columns")
+
     def __init__(
         self,
         width: float,
@@ -1165,9 +1245,12 @@ class Layout(Container):
         return width
 
     def _calculate_content_width(self) -> float:
-        width = sum(c.total_width + c.gutter for c in self._columns[:-1])
-        if self._columns:
-            width += self._columns[-1].total_width
+        columns = self._columns
+        width = 0.0
+        if columns:
+            for column in columns[:-1]:
+                width += column.total_width + column._gutter
+            width += columns[-1].total_width
         return width
 
     @property
@@ -1220,14 +1303,37 @@ class Layout(Container):
         left, top = insert_location(align, width, height)
         super().place(x + left, y + top)
 
+    def render(self, m: Matrix44 = None) -> None:
+        """Render the layout and all sub-containers at the final location.
+
+        The container hierarchy is traversed by an explicit stack instead of
+        nested render() calls, the rendering order is the same.
+        """
+        if m is not None and tuple(m) == _IDENTITY:
+            # the content renderers skip the transformation for m=None
+            m = None
+        stack: list[Box] = [self]
+        while stack:
+            box = stack.pop()
+            if isinstance(box, Container):
+                if not box.is_placed():
+                    raise LayoutError("Layout has to be placed before rendering")
+                if box.renderer:
+                    box.render_background(m)
+                children = list(box)
+                children.reverse()
+                stack.extend(children)
+            else:  # content cells like lines and paragraph spacers
+                box.render(m)
+
     def place_content(self):
         """Place content at the final location."""
         x, y = self.final_location()
-        x = x + self.left_margin
-        y = y - self.top_margin
-        for column in self:
+        x = x + self._left_margin
+        y = y - self._top_margin
+        for column in self._columns:
             column.place(x, y)
-            x += column.total_width + column.gutter
+            x += column.total_width + column._gutter
 
     def append_column(
         self,
@@ -1285,6 +1391,8 @@ def linear_placing(cells: Sequence[Cell], x: float, y: float):
 
 
 class RigidConnection(ContentCell):
+    __slots__ = ("_cells",)
+
     def __init__(
         self, cells: Optional[Iterable[Cell]] = None, valign=CellAlignment.BOTTOM
     ):
@@ -1329,11 +1437,11 @@ def group_non_breakable_cells(cells: list[Cell]) -> list[Cell]:
     new_cells = []
     while index < count:
         cell = cells[index]
-        if isinstance(cell, _no_break):
+        if cell.kind in _NO_BREAK_KINDS:
             start = index
             index += 1
             while index < count:
-                if not isinstance(cells[index], _no_break):
+                if cells[index].kind not in _NO_BREAK_KINDS:
                     append_rigid_content(start, index)
                     break
                 index += 1
@@ -1368,7 +1476,13 @@ class AppendType(enum.IntEnum):
     FORCED = 2
 
 
+# module level constants for the core loop of the line breaking process
+_FAIL, _SUCCESS, _FORCED = AppendType.FAIL, AppendType.SUCCESS, AppendType.FORCED
+
+
 class AbstractLine(ContentCell):  # ABC
+    __slots__ = ("_cells", "_current_offset")
+
     has_tab_support = False
 
     def __init__(self, width: float):
@@ -1422,8 +1536,8 @@ class AbstractLine(ContentCell):  # ABC
             return max(c.cell.total_height for c in self._cells)
         return 0.0
 
-    def cells(self) -> Iterable[Cell]:
-        """Yield line content including RigidConnections."""
+    def cells(self) -> list[Cell]:
+        """Returns line content including RigidConnections."""
         return [c.cell for c in self._cells]
 
     def flatten(self) -> Iterable[Cell]:
@@ -1435,7 +1549,7 @@ class AbstractLine(ContentCell):  # ABC
                 yield cell
 
     def render(self, m: Matrix44 = None) -> None:
-        cells = list(self.cells())
+        cells = self.cells()  # returns a new list
         render_cells(cells, m)
         render_text_strokes(cells, m)
 
@@ -1451,6 +1565,8 @@ class AbstractLine(ContentCell):  # ABC
 
 
 class LeftLine(AbstractLine):
+    __slots__ = ("_tab_stops",)
+
     has_tab_support = True
 
     def __init__(self, width: float, tab_stops: Optional[Sequence[TabStop]] = None):
@@ -1463,17 +1579,19 @@ class LeftLine(AbstractLine):
         self._cells.append(LineCell(cell, offset, locked))
 
     def append(self, cell: Cell) -> AppendType:
+        # Core loop of the line breaking process, called for each cell:
         width = cell.total_width
-        if self._current_offset + width <= self.line_width:
-            self._append_line_cell(cell, self._current_offset)
-            self._current_offset += width
-            return AppendType.SUCCESS
+        offset = self._current_offset
+        if offset + width <= self._width:  # self._width is the line width
+            self._cells.append(LineCell(cell, offset, False))
+            self._current_offset = offset + width
+            return _SUCCESS
         if len(self._cells) == 0:
             # single cell is too wide for a line,
             # forced rendering with oversize
-            self._append_line_cell(cell, 0)
-            return AppendType.FORCED
-        return AppendType.FAIL
+            self._cells.append(LineCell(cell, 0, False))
+            return _FORCED
+        return _FAIL
 
     def append_with_tab(self, cell: Cell, tab: Tabulator) -> AppendType:
         width = cell.total_width
@@ -1528,12 +1646,18 @@ class LeftLine(AbstractLine):
         return AppendType.SUCCESS
 
     def _next_tab_stop(self, left, center, right):
+        # left <= center <= right: tab stops at or before the left position
+        # can be skipped without checking the tab stop type
         for tab in self._tab_stops:
-            if tab.kind == TabStopType.LEFT and tab.pos > left:
-                return tab
-            elif tab.kind == TabStopType.CENTER and tab.pos > center:
+            pos, kind = tab
+            if pos <= left:
+                continue
+            if kind == TabStopType.LEFT:
                 return tab
-            elif tab.kind == TabStopType.RIGHT and tab.pos > right:
+            elif kind == TabStopType.CENTER:
+                if pos > center:
+                    return tab
+            elif pos > right:
                 return tab
         return None
 
@@ -1567,6 +1691,8 @@ def update_offsets(cells: list[LineCell], index: int) -> None:
 
 
 class JustifiedLine(LeftLine):
+    __slots__ = ()
+
     def distribute(self):
         cells = self._cells
         last_locked_cell = self._last_locked_cell()
@@ -1613,22 +1739,25 @@ class JustifiedLine(LeftLine):
 class NoTabLine(AbstractLine):
     """Base class for lines without tab stop support!"""
 
+    __slots__ = ()
+
     has_tab_support = False
 
     def append(self, cell: Cell) -> AppendType:
         if isinstance(cell, Tabulator):
             cell = cell.to_space()
         width = cell.total_width
-        if self._current_offset + width < self.line_width:
-            self._cells.append(LineCell(cell, self._current_offset, False))
-            self._current_offset += width
-            return AppendType.SUCCESS
+        offset = self._current_offset
+        if offset + width < self._width:  # self._width is the line width
+            self._cells.append(LineCell(cell, offset, False))
+            self._current_offset = offset + width
+            return _SUCCESS
         if len(self._cells) == 0:
             # single cell is too wide for a line,
             # forced rendering with oversize
             self._cells.append(LineCell(cell, 0, False))
-            return AppendType.FORCED
-        return AppendType.FAIL
+            return _FORCED
+        return _FAIL
 
     def append_with_tab(self, cell: Cell, tab: Tabulator) -> AppendType:
         """No tabulator support!"""
@@ -1646,6 +1775,8 @@ class NoTabLine(AbstractLine):
 class CenterLine(NoTabLine):
     """Right aligned lines do not support tab stops!"""
 
+    __slots__ = ()
+
     def start_offset(self) -> float:
         real_width = sum(c.cell.total_width for c in self._cells)
         return (self.line_width - real_width) / 2
@@ -1654,6 +1785,8 @@ class CenterLine(NoTabLine):
 class RightLine(NoTabLine):
     """Right aligned lines do not support tab stops!"""
 
+    __slots__ = ()
+
     def start_offset(self) -> float:
         real_width = sum(c.cell.total_width for c in self._cells)
         return self.line_width - real_width
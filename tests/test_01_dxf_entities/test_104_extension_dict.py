@@ -6,6 +6,7 @@ import ezdxf
 from ezdxf.document import Drawing
 from ezdxf.entities import factory, DXFEntity
 from ezdxf.entities.xdict import ExtensionDict
+from ezdxf.lldxf.tagwriter import TagCollector
 
 
 @pytest.fixture(scope="module")
@@ -52,6 +53,16 @@ def test_supports_handle_property(doc):
     assert isinstance(xdict.handle, str)
 
 
+def test_export_current_dictionary_handle(doc):
+    xdict = ExtensionDict.new("ABBA", doc)
+    xdict.export_dxf(TagCollector())
+    assert doc.entitydb.reset_handle(xdict.dictionary, "FEFE") is True
+
+    tagwriter = TagCollector()
+    xdict.export_dxf(tagwriter)
+    assert tagwriter.tags[1] == (360, "FEFE")
+
+
 def test_line_new_extension_dict(doc):
     msp = doc.modelspace()
     entity = msp.add_line((0, 0), (10, 0))
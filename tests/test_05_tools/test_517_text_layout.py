@@ -4,6 +4,7 @@ from typing import Iterable, List
 import pytest
 from itertools import permutations
 import ezdxf.tools.text_layout as tl
+from ezdxf.math import Matrix44
 
 
 @pytest.mark.parametrize(
@@ -147,6 +148,53 @@ class TestTopLevelLayout:
         assert layout1.current_column_index == 1
         assert len(layout1) == 2, "a new column should be created"
 
+    def test_render_order_of_nested_containers(self, layout1):
+        result = layout1.renderer.result
+        layout1.append_column(width=5, gutter=1, renderer=Rect("Col1", result))
+        layout1.append_column(width=5, renderer=Rect("Col2", result))
+        paragraphs = []
+        for name in ("Par1", "Par2"):
+            paragraph = tl.Paragraph(renderer=Rect(name, result))
+            paragraph.append_content(str2cells("t t t t", content=2, result=result))
+            paragraphs.append(paragraph)
+        layout1.append_paragraphs(paragraphs)
+        layout1.next_column()
+        layout1.append_paragraphs([tl.Paragraph(renderer=Rect("Par3", result))])
+        layout1.place()
+
+        layout1.render()
+        expected = list(result)
+        result.clear()
+        # recursive rendering of the base class:
+        tl.Container.render(layout1)
+        assert result == expected
+        assert result[0].startswith("Layout1")
+        assert result[1].startswith("Col1")
+        assert result[2].startswith("Par1")
+        assert result[3].startswith("Text")
+        assert result[-2].startswith("Col2")
+        assert result[-1].startswith("Par3")
+
+
+class MatrixRecorder(tl.DoNothingRenderer):
+    def __init__(self):
+        self.matrices = []
+
+    def render(self, left, bottom, right, top, m=None) -> None:
+        self.matrices.append(m)
+
+
+def test_layout_does_not_pass_identity_matrix_to_renderers():
+    renderer = MatrixRecorder()
+    layout = tl.Layout(width=10, renderer=renderer)
+    layout.place()
+    layout.render(Matrix44())
+    assert renderer.matrices == [None]
+
+    m = Matrix44.translate(1, 2, 0)
+    layout.render(m)
+    assert renderer.matrices[1] is m
+
 
 class TestColumn:
     @pytest.fixture
@@ -173,6 +221,22 @@ class TestColumn:
         assert result[0] == "C1(0.0, -11.0, 11.0, 0.0)"
 
 
+def test_used_content_height_of_flexible_column():
+    column = tl.Column(width=10)
+    paragraphs = []
+    for content in ("t t t t", "t", "t t t t t t"):
+        paragraph = tl.Paragraph(line_spacing=1.5)
+        paragraph.append_content(str2cells(content))
+        paragraphs.append(paragraph)
+    assert column.append_paragraphs(paragraphs) == []
+    expected = sum(
+        p.total_height + p.distance_to_next_paragraph for p in paragraphs[:-1]
+    )
+    expected += paragraphs[-1].total_height
+    assert column.used_content_height() == expected
+    assert column.content_height == expected
+
+
 def test_paragraph_available_line_content_space():
     par = tl.Paragraph(width=12, indent=(0.7, 0.5, 0.9))
     assert par.line_width(first=True) == 12 - 0.7 - 0.9
@@ -944,6 +1008,20 @@ class TestLeftLine:
         assert result[2] == "TAB-TEXT(10.0, -1.0, 12.0, 0.0)"
         assert result[3] == "TEXT(12.5, -1.0, 14.5, 0.0)"
 
+    def test_skip_center_tab_left_of_cell_center(self):
+        line = tl.LeftLine(
+            width=20,
+            tab_stops=[
+                tl.TabStop(3, tl.TabStopType.CENTER),
+                tl.TabStop(8, tl.TabStopType.LEFT),
+            ],
+        )
+        # center of the 2nd text cell is at 3.5, the center tab stop at 3 is
+        # skipped and the text is aligned to the left tab stop at 8
+        cells = str2cells("t#t", content=2, space=0.5)
+        result = render_line_with_tabs(line, cells)
+        assert result[1] == "TAB-TEXT(8.0, -1.0, 10.0, 0.0)"
+
 
 def tab_stops(*values):
     return [tl.TabStop(v) for v in values]
@@ -22,24 +22,23 @@ if USE_C_EXT:
     m44_classes.append(CMatrix44)
 
 
-@pytest.fixture(params=m44_classes)
+@pytest.fixture(scope="module", params=m44_classes)
 def m44(request):
     return request.param
 
 
 def diag(values, m44_cls):
-    m = m44_cls()
-    for i, value in enumerate(values):
-        m[i, i] = value
-    return m
+    m = [0.0] * 16
+    m[::5] = values
+    return m44_cls(m)
+
+
+def as_array(m):
+    return np.fromiter(m, dtype=np.float64, count=16)
 
 
 def equal_matrix(m1, m2, abs_tol=1e-9):
-    for row in range(4):
-        for col in range(4):
-            if not isclose(m1[row, col], m2[row, col], abs_tol=abs_tol):
-                return False
-    return True
+    return np.allclose(as_array(m1), as_array(m2), rtol=1e-9, atol=abs_tol)
 
 
 class TestMatrix44:
@@ -148,6 +147,15 @@ class TestMatrix44:
         assert matrix.get_col(2) == (0.0, 0.0, 1.0, 0.0)
         assert matrix.get_col(3) == (0.0, 0.0, 0.0, 1.0)
 
+    def test_returns_python_floats(self, m44):
+        matrix = m44(range(16))
+        assert type(matrix[1, 2]) is float
+        assert all(type(v) is float for v in matrix)
+        assert all(type(v) is float for row in matrix.rows() for v in row)
+        assert all(type(v) is float for col in matrix.columns() for v in col)
+        assert all(type(v) is float for v in matrix.get_2d_transformation())
+        assert type(matrix.determinant()) is float
+
     def test_get_col_index_error(self, m44):
         with pytest.raises(IndexError):
             m44().get_col(-1)
@@ -193,31 +201,34 @@ class TestMatrix44:
     def test_x_rotate(self, m44):
         alpha = radians(25)
         t = m44.x_rotate(alpha)
+        c, s = cos(alpha), sin(alpha)
         x = diag((1.0, 1.0, 1.0, 1.0), m44)
-        x[1, 1] = cos(alpha)
-        x[2, 1] = -sin(alpha)
-        x[1, 2] = sin(alpha)
-        x[2, 2] = cos(alpha)
+        x[1, 1] = c
+        x[2, 1] = -s
+        x[1, 2] = s
+        x[2, 2] = c
         assert equal_matrix(t, x) is True
 
     def test_y_rotate(self, m44):
         alpha = radians(25)
         t = m44.y_rotate(alpha)
+        c, s = cos(alpha), sin(alpha)
         x = diag((1.0, 1.0, 1.0, 1.0), m44)
-        x[0, 0] = cos(alpha)
-        x[2, 0] = sin(alpha)
-        x[0, 2] = -sin(alpha)
-        x[2, 2] = cos(alpha)
+        x[0, 0] = c
+        x[2, 0] = s
+        x[0, 2] = -s
+        x[2, 2] = c
         assert equal_matrix(t, x) is True
 
     def test_z_rotate(self, m44):
         alpha = radians(25)
         t = m44.z_rotate(alpha)
+        c, s = cos(alpha), sin(alpha)
         x = diag((1.0, 1.0, 1.0, 1.0), m44)
-        x[0, 0] = cos(alpha)
-        x[1, 0] = -sin(alpha)
-        x[0, 1] = sin(alpha)
-        x[1, 1] = cos(alpha)
+        x[0, 0] = c
+        x[1, 0] = -s
+        x[0, 1] = s
+        x[1, 1] = c
         assert equal_matrix(t, x) is True
 
     def test_chain(self, m44):
@@ -265,6 +276,12 @@ class TestMatrix44:
         res = m1 @ m2
         assert equal_matrix(res, expected)
 
+    def test_inplace_multiply_by_itself(self, m44):
+        m1 = m44(range(16))
+        expected = m1 @ m44(range(16))
+        m1 *= m1
+        assert equal_matrix(m1, expected)
+
     def test_transpose(self, m44):
         matrix = m44((0, 1, 2, 3), (4, 5, 6, 7), (8, 9, 10, 11), (12, 13, 14, 15))
         matrix.transpose()
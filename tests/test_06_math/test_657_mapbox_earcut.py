@@ -4,7 +4,8 @@ from typing import Iterable, Sequence, List
 import pytest
 import math
 from functools import partial
-from ezdxf.math import Vec2, BoundingBox2d, area, UVec
+from ezdxf.math import Vec2, Vec3, BoundingBox2d, area, UVec, Matrix44
+from ezdxf.math.triangulation import mapbox_earcut_3d
 from ezdxf.render import forms
 from ezdxf.math._mapbox_earcut import earcut as _py_earcut
 
@@ -143,5 +144,40 @@ def test_polygon_data0(polygon_data0, earcut):
     assert bbox0.extmax.isclose(bbox1.extmax)
 
 
+def test_mapbox_earcut_3d_returns_wcs_vertices():
+    m = Matrix44.chain(Matrix44.x_rotate(0.7), Matrix44.y_rotate(-1.3))
+    exterior = list(
+        m.transform_vertices(Vec3.generate(forms.gear(8, 1, 3, 2, 10)))
+    )
+    hole = list(m.transform_vertices(Vec3.generate(forms.circle(8, radius=2))))
+    triangles = list(mapbox_earcut_3d(exterior, [hole]))
+    assert len(triangles) > 0
+    for triangle in triangles:
+        assert len(triangle) == 3
+        for vertex in triangle:
+            assert any(vertex.isclose(v) for v in exterior + hole)
+
+
+@pytest.mark.parametrize("count", [4, 5])
+def test_mapbox_earcut_3d_convex_polygon(count):
+    m = Matrix44.chain(Matrix44.x_rotate(0.7), Matrix44.y_rotate(-1.3))
+    polygon = list(m.transform_vertices(forms.circle(count, radius=2)))
+    triangles = list(mapbox_earcut_3d(polygon))
+    assert len(triangles) == count - 2
+    assert math.isclose(
+        sum(area(triangle) for triangle in triangles), area(polygon)
+    )
+
+
+def test_mapbox_earcut_3d_concave_quadrilateral():
+    # a fan triangulation starting at the first vertex would be invalid
+    polygon = Vec3.list([(4, 0), (1, 1), (0, 4), (0, 0)])
+    triangles = list(mapbox_earcut_3d(polygon))
+    assert len(triangles) == 2
+    assert math.isclose(
+        sum(area(triangle) for triangle in triangles), area(polygon)
+    )
+
+
 if __name__ == "__main__":
     pytest.main([__file__])